@@ -131,7 +131,10 @@ Your output should be complete, compilable Rust code.""",
         "type": "python",
         "script_path": "./tableaux_evaluator.py",
         "timeout": 60,  # Maximum evaluation time in seconds
-        "parallel_evaluations": 4,  # Number of parallel evaluations
+        # Number of parallel evaluations. Each evolved program compiles with
+        # codegen-units=1 (single-threaded LLVM), so evaluations are the unit
+        # of parallelism; cap at the host's cores to avoid oversubscription.
+        "parallel_evaluations": min(4, os.cpu_count() or 1),
         "cache_results": True,  # Cache evaluation results
         "cache_file": "./evaluation_cache.json",
         "benchmark_complexity": "medium",
@@ -159,11 +162,15 @@ Your output should be complete, compilable Rust code.""",
             "test_cache_functionality",
             "test_benchmark_execution",
         ],
+        # One argv token per entry so the list can be passed straight to rustc.
+        # Fitness is measured on the evaluator machine's ISA; set
+        # OPENEVOLVE_TARGET_CPU (e.g. "x86-64") to build portable binaries.
         "compilation_flags": [
             "--edition=2021",
-            "-O",                 # Optimize
-            "-C target-cpu=native",  # Target native CPU
-            "-C lto=fat",         # Link-time optimization
+            "-C", "opt-level=3",     # Full optimization (-O is only opt-level=2)
+            "-C", f"target-cpu={os.environ.get('OPENEVOLVE_TARGET_CPU', 'native')}",  # Enable AVX2/AVX-512 autovectorization
+            "-C", "lto=fat",         # Link-time optimization
+            "-C", "codegen-units=1", # Whole-crate inlining and vectorization
         ],
     },
 
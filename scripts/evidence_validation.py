@@ -4,60 +4,253 @@ OWL2 Reasoner Evidence-Based Validation Script
 Generates concrete evidence of system capabilities for public publishing
 """
 
+import shlex
+import shutil
+import signal
 import subprocess
 import json
 import time
 import os
 import sys
+import tempfile
+import threading
 from pathlib import Path
 import re
 from datetime import datetime
 
+# Repository root; cargo runs here so it reuses this checkout's incremental
+# target directory (or CARGO_TARGET_DIR when one is configured). Cargo resolves
+# a relative CARGO_TARGET_DIR against the directory it runs in, i.e. REPO_ROOT
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TARGET_DIR = REPO_ROOT / (os.environ.get("CARGO_TARGET_DIR") or "target")
+EXAMPLES_DIR = TARGET_DIR / "release" / "examples"
+
+# Route cargo's rustc invocations through sccache when it is installed (and no
+# wrapper is configured) so compiled crates are shared across runs/checkouts
+COMMAND_ENV = (
+    {**os.environ, "RUSTC_WRAPPER": "sccache"}
+    if shutil.which("sccache") and "RUSTC_WRAPPER" not in os.environ
+    else None
+)
+
+# Examples exercised by the validation phases; built once, then run directly
+EXAMPLES = ("simple_example", "family_ontology", "epcis_validation_suite")
+
+# Set VALIDATION_PIN_CPU=<n> to pin timed example runs to one core via taskset
+# (Linux), removing scheduler migration noise from the reasoning timings
+PIN_CPU = os.environ.get("VALIDATION_PIN_CPU")
+
+# Untimed runs of the reasoning example before the measured one, so page
+# cache, dynamic loader and CPU frequency state are warm (VALIDATION_WARMUP_RUNS)
+WARMUP_RUNS = int(os.environ.get("VALIDATION_WARMUP_RUNS", "1"))
+
+# Most characters of each command's stdout/stderr kept in the JSON report; cargo
+# and libtest put their summaries at the end, so the tail is what matters
+REPORT_OUTPUT_TAIL = 4096
+
+# libtest output patterns, compiled once and shared by every phase
+RUNNING_TESTS_RE = re.compile(r'running (\d+) tests')
+TEST_OUTCOME_RE = re.compile(r'^test (.+?) \.\.\. (ok|FAILED|ignored)', re.M)
+
+# In-process timing printed by the family_ontology example
+REASONING_TIME_RE = re.compile(r'Reasoning time: ([\d.]+) ms')
+
+# Case-insensitive output indicators; searching avoids lower()-copying the
+# whole of a (possibly large) example output for each keyword
+MEMORY_INDICATOR_RE = re.compile(r'memory|allocation', re.I)
+REASONING_INDICATOR_RE = re.compile(r'classified|consistency', re.I)
+EPCIS_INDICATOR_RE = re.compile(r'epcis', re.I)
+
+# Fixed validation tables, built once at import rather than on every call
+PARSER_FORMATS = ("turtle", "rdf_xml", "owl_functional", "owl_xml")
+OWL2_TEST_AREAS = (
+    "test_axioms", "test_entities", "test_reasoning",
+    "test_parser", "test_ontology", "test_profiles"
+)
+VALIDATION_AREAS = (
+    ("compilation", "code_quality"),
+    ("memory_efficiency", "performance"),
+    ("owl2_compliance", "owl2_standards"),
+    ("parser_capabilities", "multi_format_parsing"),
+    ("reasoning_performance", "reasoning_engine"),
+    ("epcis_integration", "ecosystem_integration")
+)
+
+
+def _trim_outputs(result):
+    """Copy a result dict with captured output cut down to a bounded tail"""
+    trimmed = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            value = _trim_outputs(value)
+        elif key in ("stdout", "stderr") and len(value) > REPORT_OUTPUT_TAIL:
+            tail = value[-REPORT_OUTPUT_TAIL:]
+            # Drop the partial line the cut landed in, unless the tail is all
+            # one (long, still useful) final line
+            newline = tail.find("\n")
+            if 0 <= newline < len(tail) - 1:
+                tail = tail[newline + 1:]
+            value = "[...]\n" + tail
+        trimmed[key] = value
+    return trimmed
+
+
+def _prewarm(path):
+    """Pull a file into the page cache so a timed run doesn't pay for cold reads"""
+    try:
+        with open(path, "rb", buffering=0) as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            while f.read(1 << 20):
+                pass
+    except OSError:
+        pass
+
+
 class EvidenceValidator:
     def __init__(self):
         self.results = {}
         self.validation_dir = Path("validation_results")
         self.validation_dir.mkdir(exist_ok=True)
+        self.examples_built = None
+        self.command_cache = {}
 
     def run_command(self, command, timeout=60):
-        """Run a command and capture output"""
-        try:
-            start_time = time.time()
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd="/Users/anusornchaikaew/Work/Phd/KnowledgeGraph/owl2-reasoner"
-            )
-            end_time = time.time()
+        """Run a command and capture output
 
-            return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "execution_time": end_time - start_time,
-                "command": command
-            }
-        except subprocess.TimeoutExpired:
+        Commands are exec'd directly from an argv list (strings are split with
+        shlex) so no intermediate /bin/sh is forked for every invocation.
+        """
+        argv = shlex.split(command) if isinstance(command, str) else list(command)
+        command = shlex.join(argv)
+        try:
+            with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+                # perf_counter is monotonic and high resolution, unlike time.time()
+                start_time = time.perf_counter()
+                # A resolved executable path, close_fds=False and no cwd change
+                # let CPython launch via posix_spawn instead of fork+exec; our
+                # own descriptors are non-inheritable (PEP 446), so none leak
+                process = subprocess.Popen(
+                    argv,
+                    executable=shutil.which(argv[0]) or argv[0],
+                    stdout=stdout_file,
+                    stderr=stderr_file,
+                    cwd=None if Path.cwd() == REPO_ROOT else REPO_ROOT,
+                    env=COMMAND_ENV,
+                    close_fds=False
+                )
+                # The timer thread only signals; it must never reap the child
+                # (Popen.kill() polls with waitpid), or waitpid below would lose
+                # it. Where os.waitid exists (not on macOS before Python 3.13)
+                # the child is first waited for without reaping, so it stays a
+                # zombie holding its pid until the timer is disarmed.
+                timed_out = threading.Event()
+                exit_lock = threading.Lock()
+                exited = False
+
+                def kill_on_timeout():
+                    with exit_lock:
+                        if not exited:
+                            timed_out.set()
+                            os.kill(process.pid, signal.SIGKILL)
+
+                timer = threading.Timer(timeout, kill_on_timeout)
+                timer.start()
+                try:
+                    if hasattr(os, "waitid"):
+                        os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+                        with exit_lock:
+                            exited = True
+                        _, status = os.waitpid(process.pid, 0)
+                    else:
+                        # Without waitid the timer stays armed until the child
+                        # is reaped, leaving a brief window for a stale kill
+                        _, status = os.waitpid(process.pid, 0)
+                        with exit_lock:
+                            exited = True
+                    process.returncode = os.waitstatus_to_exitcode(status)
+                finally:
+                    timer.cancel()
+                end_time = time.perf_counter()
+
+                # The timer may fire just as the child exits on its own; only
+                # a child that actually died from our SIGKILL timed out
+                if timed_out.is_set() and process.returncode == -signal.SIGKILL:
+                    return {
+                        "success": False,
+                        "stdout": "",
+                        "stderr": "Timeout exceeded",
+                        "error": "Timeout exceeded",
+                        "execution_time": timeout
+                    }
+
+                stdout_file.seek(0)
+                stderr_file.seek(0)
+                return {
+                    "success": process.returncode == 0,
+                    "stdout": stdout_file.read().decode(errors="replace"),
+                    "stderr": stderr_file.read().decode(errors="replace"),
+                    "execution_time": end_time - start_time,
+                    "command": command
+                }
+        except Exception as e:
+            # e.g. FileNotFoundError for a missing executable, which /bin/sh
+            # used to turn into exit code 127; callers still expect output keys
             return {
                 "success": False,
-                "error": "Timeout exceeded",
-                "execution_time": timeout
+                "stdout": "",
+                "stderr": str(e),
+                "error": str(e),
+                "execution_time": 0
             }
-        except Exception as e:
+
+    def run_cached(self, command, timeout=60):
+        """Run a deterministic check command at most once per validation run
+
+        Several phases inspect the same command (e.g. ``cargo test --lib``);
+        the source tree does not change mid-run, so later phases reuse the
+        first result instead of re-running the whole suite. Timeouts and
+        launch errors are not outcomes of the check and are never cached, so a
+        later phase retries them (e.g. on a build the first attempt warmed).
+        """
+        if command in self.command_cache:
+            return self.command_cache[command]
+        result = self.run_command(command, timeout)
+        if "error" not in result:
+            self.command_cache[command] = result
+        return result
+
+    def build_examples(self):
+        """Build all release examples in one cargo invocation, once per run"""
+        if self.examples_built is None:
+            example_flags = " ".join(f"--example {name}" for name in EXAMPLES)
+            result = self.run_command(f"cargo build --release {example_flags}", timeout=600)
+            self.results["example_build"] = result
+            self.examples_built = result["success"]
+        return self.examples_built
+
+    def run_example(self, name, timeout=60):
+        """Run a prebuilt release example without going back through cargo"""
+        if not self.build_examples():
             return {
                 "success": False,
-                "error": str(e),
+                "stdout": "",
+                "stderr": "Release build of examples failed",
+                "error": "Release build of examples failed",
                 "execution_time": 0
             }
+        binary = EXAMPLES_DIR / name
+        _prewarm(binary)
+        argv = [str(binary)]
+        if PIN_CPU is not None and shutil.which("taskset"):
+            argv = ["taskset", "-c", PIN_CPU] + argv
+        return self.run_command(argv, timeout=timeout)
 
     def test_basic_compilation(self):
         """Test that the project compiles successfully"""
         print("🧪 Testing basic compilation...")
 
-        result = self.run_command("cargo check")
+        result = self.run_cached("cargo check")
         self.results["compilation"] = result
 
         if result["success"]:
@@ -72,7 +265,7 @@ class EvidenceValidator:
         """Test core library functionality"""
         print("🧪 Testing library functionality...")
 
-        result = self.run_command("cargo test --lib")
+        result = self.run_cached("cargo test --lib")
         self.results["library_tests"] = result
 
         if result["success"]:
@@ -80,7 +273,7 @@ class EvidenceValidator:
             test_output = result["stdout"]
             if "test result: ok." in test_output:
                 # Extract test count
-                match = re.search(r'running (\d+) tests', test_output)
+                match = RUNNING_TESTS_RE.search(test_output)
                 if match:
                     test_count = int(match.group(1))
                     print(f"   ✅ All {test_count} library tests pass")
@@ -101,13 +294,12 @@ class EvidenceValidator:
         print("🧪 Testing memory efficiency...")
 
         # Build in release mode for accurate measurement
-        build_result = self.run_command("cargo build --release")
-        if not build_result["success"]:
+        if not self.build_examples():
             print("   ❌ Release build failed")
             return False
 
         # Test with a simple example that uses memory optimization
-        result = self.run_command("cargo run --release --example simple_example")
+        result = self.run_example("simple_example")
         self.results["memory_efficiency"] = result
 
         if result["success"]:
@@ -115,7 +307,7 @@ class EvidenceValidator:
 
             # Look for memory-related metrics in output
             output = result["stdout"]
-            if "memory" in output.lower() or "allocation" in output.lower():
+            if MEMORY_INDICATOR_RE.search(output):
                 print("   📊 Memory usage information available in output")
 
             return True
@@ -127,27 +319,19 @@ class EvidenceValidator:
         """Test OWL2 compliance through existing test suite"""
         print("🧪 Testing OWL2 compliance...")
 
-        result = self.run_command("cargo test --lib")
+        result = self.run_cached("cargo test --lib")
         self.results["owl2_compliance"] = result
 
         if result["success"]:
             output = result["stdout"]
 
             # Count different types of tests that passed
-            owl2_tests = [
-                "test_axioms", "test_entities", "test_reasoning",
-                "test_parser", "test_ontology", "test_profiles"
-            ]
-
-            compliant_areas = 0
-            for test_area in owl2_tests:
-                if test_area in output:
-                    compliant_areas += 1
+            compliant_areas = sum(test_area in output for test_area in OWL2_TEST_AREAS)
 
-            print(f"   ✅ OWL2 compliance demonstrated in {compliant_areas}/{len(owl2_tests)} areas")
+            print(f"   ✅ OWL2 compliance demonstrated in {compliant_areas}/{len(OWL2_TEST_AREAS)} areas")
 
             # Extract total test count
-            match = re.search(r'running (\d+) tests', output)
+            match = RUNNING_TESTS_RE.search(output)
             if match:
                 total_tests = int(match.group(1))
                 print(f"   📊 {total_tests} comprehensive tests validate OWL2 features")
@@ -162,13 +346,24 @@ class EvidenceValidator:
         """Test multi-format parser capabilities"""
         print("🧪 Testing parser capabilities...")
 
-        formats = ["turtle", "rdf_xml", "owl_functional", "owl_xml"]
         working_formats = 0
 
-        for format_name in formats:
-            # Find a test for this format
-            result = self.run_command(f"cargo test test_{format_name}")
-            if result["success"]:
+        # Run the tests for every format in one cargo invocation (libtest takes
+        # several filters) and attribute each test outcome back to its format
+        filters = " ".join(f"test_{format_name}" for format_name in PARSER_FORMATS)
+        result = self.run_command(f"cargo test --no-fail-fast -- {filters}", timeout=240)
+        suite_ran = "test result:" in result.get("stdout", "")
+        failed_tests = [
+            name for name, outcome in TEST_OUTCOME_RE.findall(result.get("stdout", ""))
+            if outcome == "FAILED"
+        ]
+        # A test binary that aborts (segfault, stack overflow, panic=abort)
+        # fails the run without printing a FAILED line, so the failure can't
+        # be attributed to a format; count none as working in that case
+        outcomes_attributable = suite_ran and (result["success"] or bool(failed_tests))
+
+        for format_name in PARSER_FORMATS:
+            if outcomes_attributable and not any(f"test_{format_name}" in name for name in failed_tests):
                 working_formats += 1
                 print(f"   ✅ {format_name} parser working")
             else:
@@ -177,33 +372,42 @@ class EvidenceValidator:
         self.results["parser_capabilities"] = working_formats
 
         if working_formats >= 3:
-            print(f"   📊 {working_formats}/{len(formats)} parser formats working")
+            print(f"   📊 {working_formats}/{len(PARSER_FORMATS)} parser formats working")
             return working_formats
         else:
-            print(f"   ❌ Only {working_formats}/{len(formats)} parser formats working")
+            print(f"   ❌ Only {working_formats}/{len(PARSER_FORMATS)} parser formats working")
             return False
 
     def test_reasoning_performance(self):
         """Test reasoning performance capabilities"""
         print("🧪 Testing reasoning performance...")
 
-        # Run a simple reasoning test and measure time
-        start_time = time.time()
-        result = self.run_command("cargo run --release --example family_ontology")
-        end_time = time.time()
+        # Warm-up runs are discarded; only the run after them is reported
+        for _ in range(WARMUP_RUNS):
+            self.run_example("family_ontology")
+
+        # Run a simple reasoning test; run_command already times the process,
+        # while the example reports the reasoning itself without exec/startup
+        result = self.run_example("family_ontology")
+        execution_time = result["execution_time"]
+        match = REASONING_TIME_RE.search(result.get("stdout", ""))
+        reasoning_time_ms = float(match.group(1)) if match else None
 
         self.results["reasoning_performance"] = {
             "command_result": result,
-            "wall_clock_time": end_time - start_time
+            "wall_clock_time": execution_time,
+            "reasoning_time_ms": reasoning_time_ms,
+            "warmup_runs": WARMUP_RUNS
         }
 
         if result["success"]:
-            execution_time = end_time - start_time
             print(f"   ✅ Reasoning example completed in {execution_time:.2f}s")
+            if reasoning_time_ms is not None:
+                print(f"   📊 In-process reasoning time: {reasoning_time_ms:.3f} ms")
 
             # Analyze output for performance indicators
             output = result["stdout"]
-            if "classified" in output.lower() or "consistency" in output.lower():
+            if REASONING_INDICATOR_RE.search(output):
                 print("   📊 Reasoning operations successfully completed")
 
             return execution_time
@@ -215,7 +419,7 @@ class EvidenceValidator:
         """Test EPCIS integration capabilities"""
         print("🧪 Testing EPCIS integration...")
 
-        result = self.run_command("cargo run --release --example epcis_validation_suite")
+        result = self.run_example("epcis_validation_suite")
         self.results["epcis_integration"] = result
 
         if result["success"]:
@@ -223,7 +427,7 @@ class EvidenceValidator:
 
             # Look for EPCIS-specific output
             output = result["stdout"]
-            if "epcis" in output.lower():
+            if EPCIS_INDICATOR_RE.search(output):
                 print("   📊 EPCIS-specific functionality demonstrated")
 
             return True
@@ -235,8 +439,10 @@ class EvidenceValidator:
         """Test code quality metrics"""
         print("🧪 Testing code quality...")
 
-        # Check for compilation warnings
-        result = self.run_command("cargo check --release")
+        # Check for compilation warnings; cargo check only emits metadata (no
+        # codegen or linking), and the dev-profile run from the compilation
+        # phase already carries every warning, so reuse it
+        result = self.run_cached("cargo check")
         self.results["code_quality"] = result
 
         if result["success"]:
@@ -257,20 +463,22 @@ class EvidenceValidator:
         """Generate comprehensive evidence report"""
         print("📊 Generating evidence report...")
 
+        # One timestamp for the run, shared by the JSON and markdown reports
+        generated_at = datetime.now()
+
         report = {
-            "timestamp": datetime.now().isoformat(),
-            "validation_results": self.results,
+            "timestamp": generated_at.isoformat(),
+            "validation_results": _trim_outputs(self.results),
             "system_info": self.get_system_info(),
             "evidence_summary": self.summarize_evidence()
         }
 
         # Save report
         report_path = self.validation_dir / "evidence_report.json"
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        report_path.write_text(json.dumps(report, indent=2))
 
-        # Generate human-readable summary
-        self.generate_human_readable_report()
+        # Generate human-readable summary from the same evidence summary
+        self.generate_human_readable_report(report["evidence_summary"], generated_at)
 
         return report
 
@@ -295,24 +503,15 @@ class EvidenceValidator:
 
         # Count library tests
         if "library_tests" in self.results and self.results["library_tests"]["success"]:
-            match = re.search(r'running (\d+) tests', self.results["library_tests"]["stdout"])
+            match = RUNNING_TESTS_RE.search(self.results["library_tests"]["stdout"])
             if match:
                 summary["total_tests"] = int(match.group(1))
                 summary["successful_areas"] += 1
                 summary["claims_validated"]["test_coverage"] = f"{summary['total_tests']} tests"
 
         # Check other validation areas
-        validation_areas = [
-            ("compilation", "code_quality"),
-            ("memory_efficiency", "performance"),
-            ("owl2_compliance", "owl2_standards"),
-            ("parser_capabilities", "multi_format_parsing"),
-            ("reasoning_performance", "reasoning_engine"),
-            ("epcis_integration", "ecosystem_integration")
-        ]
-
         validated_claims = 0
-        for area, claim in validation_areas:
+        for area, claim in VALIDATION_AREAS:
             if area in self.results:
                 if area == "parser_capabilities":
                     if isinstance(self.results[area], int) and self.results[area] >= 3:  # At least 3 parser formats working
@@ -325,7 +524,7 @@ class EvidenceValidator:
                     summary["claims_validated"][claim] = "validated"
 
         # Calculate confidence level
-        total_areas = len(validation_areas)
+        total_areas = len(VALIDATION_AREAS)
         if summary["successful_areas"] >= total_areas * 0.8:
             summary["confidence_level"] = "high"
         elif summary["successful_areas"] >= total_areas * 0.6:
@@ -333,19 +532,18 @@ class EvidenceValidator:
 
         return summary
 
-    def generate_human_readable_report(self):
-        """Generate human-readable validation report"""
+    def generate_human_readable_report(self, summary, generated_at):
+        """Generate human-readable validation report from an evidence summary"""
         report_path = self.validation_dir / "validation_report.md"
 
         with open(report_path, 'w') as f:
             f.write("# OWL2 Reasoner Validation Report\n\n")
-            f.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"**Generated**: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
             f.write("## Executive Summary\n\n")
-            summary = self.summarize_evidence()
 
             f.write(f"This report provides concrete evidence for the OWL2 reasoner's capabilities. ")
-            f.write(f"**{summary['successful_areas']} out of {len(['compilation', 'memory_efficiency', 'owl2_compliance', 'parser_capabilities', 'reasoning_performance', 'epcis_integration'])}** validation areas passed successfully.\n\n")
+            f.write(f"**{summary['successful_areas']} out of {len(VALIDATION_AREAS)}** validation areas passed successfully.\n\n")
 
             if summary["confidence_level"] == "high":
                 f.write("🎉 **High Confidence**: The system demonstrates solid capabilities across multiple validation areas.\n\n")
@@ -397,7 +595,7 @@ class EvidenceValidator:
             if "parser_capabilities" in self.results:
                 formats = self.results["parser_capabilities"]
                 f.write("### Multi-Format Parsing\n")
-                f.write(f"✅ **Multiple parser formats working** - {formats}/4 formats functional\n")
+                f.write(f"✅ **Multiple parser formats working** - {formats}/{len(PARSER_FORMATS)} formats functional\n")
                 f.write("- Turtle, RDF/XML, OWL Functional, OWL XML support\n")
                 f.write("- Auto-detection capabilities\n")
                 f.write("\n")
@@ -408,6 +606,9 @@ class EvidenceValidator:
                 if self.results["reasoning_performance"]["command_result"]["success"]:
                     exec_time = self.results["reasoning_performance"]["wall_clock_time"]
                     f.write(f"✅ **Reasoning engine functional** - Completes in {exec_time:.2f}s\n")
+                    reasoning_time_ms = self.results["reasoning_performance"]["reasoning_time_ms"]
+                    if reasoning_time_ms is not None:
+                        f.write(f"- In-process reasoning time: {reasoning_time_ms:.3f} ms\n")
                     f.write("- Tableaux-based reasoning algorithm\n")
                     f.write("- Classification and consistency checking\n")
                 f.write("\n")
@@ -427,7 +628,7 @@ class EvidenceValidator:
             claims_evidence = {
                 "56x Memory Efficiency": "Memory optimization examples run successfully, zero warnings",
                 "~90% OWL2 Compliance": f"{summary['total_tests']} comprehensive tests pass",
-                "Multi-format Parsers": f"{self.results.get('parser_capabilities', 0)}/4 formats working",
+                "Multi-format Parsers": f"{self.results.get('parser_capabilities', 0)}/{len(PARSER_FORMATS)} formats working",
                 "Production Ready": "All validation areas pass with high confidence"
             }
 
@@ -501,11 +702,22 @@ class EvidenceValidator:
         ]
 
         results = {}
+        compiles = True
         for test_name, test_func in validation_tests:
             print(f"\n📋 {test_name}")
             print("-" * 40)
+            if not compiles:
+                # Every later phase builds the crate, so none of them can pass
+                print("   ⏭️  Skipped: project does not compile")
+                results[test_name] = False
+                print()
+                continue
             result = test_func()
             results[test_name] = result
+            if test_func == self.test_basic_compilation:
+                # A timed-out check (likely a cold build) says nothing about
+                # whether the code compiles, so only a real failure skips
+                compiles = result or "error" in self.results["compilation"]
             print()
 
         print("📊 **Generating Evidence Report**")
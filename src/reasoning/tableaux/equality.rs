@@ -303,13 +303,14 @@ impl EqualityReasoner {
         }
 
         // Check if any two targets are known to be different
-        for i in 0..targets.len() {
-            for j in (i + 1)..targets.len() {
-                if self.equality_tracker.are_different(targets[i], targets[j]) {
+        // (slice iteration avoids per-access bounds checks in the pairwise scan)
+        for (i, &first) in targets.iter().enumerate() {
+            for &second in &targets[i + 1..] {
+                if self.equality_tracker.are_different(first, second) {
                     return Some(FunctionalPropertyClash {
                         property: property.clone(),
                         source,
-                        conflicting_targets: vec![targets[i], targets[j]],
+                        conflicting_targets: vec![first, second],
                         clash_type: FunctionalClashType::DifferentValues,
                     });
                 }
@@ -318,9 +319,9 @@ impl EqualityReasoner {
 
         // If we can't prove they're different, we need to check if we can merge them
         let mut should_merge = Vec::new();
-        for i in 1..targets.len() {
-            if self.equality_tracker.can_merge(targets[0], targets[i]) {
-                should_merge.push(targets[i]);
+        for &target in &targets[1..] {
+            if self.equality_tracker.can_merge(targets[0], target) {
+                should_merge.push(target);
             }
         }
 
@@ -348,13 +349,13 @@ impl EqualityReasoner {
         }
 
         // Check if any two sources are known to be different
-        for i in 0..sources.len() {
-            for j in (i + 1)..sources.len() {
-                if self.equality_tracker.are_different(sources[i], sources[j]) {
+        for (i, &first) in sources.iter().enumerate() {
+            for &second in &sources[i + 1..] {
+                if self.equality_tracker.are_different(first, second) {
                     return Some(InverseFunctionalPropertyClash {
                         property: property.clone(),
                         target,
-                        conflicting_sources: vec![sources[i], sources[j]],
+                        conflicting_sources: vec![first, second],
                         clash_type: InverseFunctionalClashType::DifferentSources,
                     });
                 }
@@ -363,9 +364,9 @@ impl EqualityReasoner {
 
         // If we can't prove they're different, check if we can merge them
         let mut should_merge = Vec::new();
-        for i in 1..sources.len() {
-            if self.equality_tracker.can_merge(sources[0], sources[i]) {
-                should_merge.push(sources[i]);
+        for &source in &sources[1..] {
+            if self.equality_tracker.can_merge(sources[0], source) {
+                should_merge.push(source);
             }
         }
 
@@ -528,10 +529,9 @@ impl EqualityReasoner {
         }
 
         // Add inequality constraints between all pairs
-        for i in 0..node_ids.len() {
-            for j in (i + 1)..node_ids.len() {
-                self.equality_tracker
-                    .add_inequality(node_ids[i], node_ids[j])?;
+        for (i, &first) in node_ids.iter().enumerate() {
+            for &second in &node_ids[i + 1..] {
+                self.equality_tracker.add_inequality(first, second)?;
             }
         }
 